@@ -9,14 +9,23 @@ The module automatically loads .env files from the project root on import.
 """
 
 import os
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Dict, Optional
 
-from dotenv import load_dotenv
 
+# Set to the resolved .env path (or "" if none) so child processes skip discovery
+DOTENV_PATH_VAR = "BROWSEROS_DOTENV"
+
+_dotenv_loaded = False
+
+
+def _find_dotenv_file() -> Optional[Path]:
+    """Locate the .env file, preferring a path inherited from the parent process"""
+    inherited = os.environ.get(DOTENV_PATH_VAR)
+    if inherited is not None:
+        return Path(inherited) if inherited else None
 
-def _load_dotenv_file():
-    """Load .env file from project root"""
     from .paths import get_package_root
 
     browseros_root = get_package_root()
@@ -29,9 +38,28 @@ def _load_dotenv_file():
     ]
 
     for env_path in env_locations:
-        if env_path.exists():
-            load_dotenv(env_path)
-            return
+        try:
+            os.stat(env_path)
+        except OSError:
+            continue
+        return env_path
+    return None
+
+
+def _load_dotenv_file():
+    """Load .env file from project root (once per interpreter)"""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
+
+    env_path = _find_dotenv_file()
+    os.environ[DOTENV_PATH_VAR] = str(env_path) if env_path else ""
+    if env_path:
+        # Imported lazily so runs without a .env (e.g. CI) skip dotenv entirely
+        from dotenv import load_dotenv
+
+        load_dotenv(env_path, override=False)
 
 
 # Load .env on module import
@@ -46,111 +74,149 @@ class EnvConfig:
     used by the build system. It serves as the single source of truth for
     what environment variables are available and what they're used for.
 
+    Values are read from os.environ on first access and cached on the
+    instance; later changes to os.environ are not seen until refresh().
+
     Usage:
         env = EnvConfig()
         if env.chromium_src:
             chromium_path = Path(env.chromium_src)
     """
 
+    # Property name -> environment variable it reads. Properties look their
+    # variable up here, so this is the one place env var names are spelled.
+    _ENV_VAR_MAP: ClassVar[Dict[str, str]] = {
+        "chromium_src": "CHROMIUM_SRC",
+        "arch": "ARCH",
+        "pythonpath": "PYTHONPATH",
+        "depot_tools_win_toolchain": "DEPOT_TOOLS_WIN_TOOLCHAIN",
+        "series_patches_three_way": "SERIES_PATCHES_3WAY",
+        "macos_certificate_name": "MACOS_CERTIFICATE_NAME",
+        "macos_notarization_apple_id": "PROD_MACOS_NOTARIZATION_APPLE_ID",
+        "macos_notarization_team_id": "PROD_MACOS_NOTARIZATION_TEAM_ID",
+        "macos_notarization_password": "PROD_MACOS_NOTARIZATION_PWD",
+        "code_sign_tool_path": "CODE_SIGN_TOOL_PATH",
+        "esigner_username": "ESIGNER_USERNAME",
+        "esigner_password": "ESIGNER_PASSWORD",
+        "esigner_totp_secret": "ESIGNER_TOTP_SECRET",
+        "esigner_credential_id": "ESIGNER_CREDENTIAL_ID",
+        "r2_account_id": "R2_ACCOUNT_ID",
+        "r2_access_key_id": "R2_ACCESS_KEY_ID",
+        "r2_secret_access_key": "R2_SECRET_ACCESS_KEY",
+        "r2_bucket": "R2_BUCKET",
+        "r2_cdn_base_url": "R2_CDN_BASE_URL",
+        "r2_endpoint_url": "R2_ACCOUNT_ID",  # computed from the account ID
+        "sparkle_private_key": "SPARKLE_PRIVATE_KEY",
+        "slack_webhook_url": "SLACK_WEBHOOK_URL",
+    }
+
     # === Build Configuration ===
 
-    @property
+    @cached_property
     def chromium_src(self) -> Optional[str]:
         """Path to Chromium source directory"""
-        return os.environ.get("CHROMIUM_SRC")
+        return os.environ.get(self._ENV_VAR_MAP["chromium_src"])
 
-    @property
+    @cached_property
     def arch(self) -> Optional[str]:
         """Target architecture (x64, arm64, universal)"""
-        return os.environ.get("ARCH")
+        return os.environ.get(self._ENV_VAR_MAP["arch"])
 
-    @property
+    @cached_property
     def pythonpath(self) -> Optional[str]:
         """Python path for build scripts"""
-        return os.environ.get("PYTHONPATH")
+        return os.environ.get(self._ENV_VAR_MAP["pythonpath"])
 
-    @property
+    @cached_property
     def depot_tools_win_toolchain(self) -> str:
         """Windows depot_tools toolchain setting (0 = use system toolchain)"""
-        return os.environ.get("DEPOT_TOOLS_WIN_TOOLCHAIN", "0")
+        return os.environ.get(self._ENV_VAR_MAP["depot_tools_win_toolchain"], "0")
+
+    @cached_property
+    def series_patches_three_way(self) -> bool:
+        """Skip a known-failing plain apply before series --3way (1 = enabled)"""
+        env_var = self._ENV_VAR_MAP["series_patches_three_way"]
+        return os.environ.get(env_var, "0") == "1"
 
     # === macOS Code Signing ===
 
-    @property
+    @cached_property
     def macos_certificate_name(self) -> Optional[str]:
         """macOS code signing certificate name"""
-        return os.environ.get("MACOS_CERTIFICATE_NAME")
+        return os.environ.get(self._ENV_VAR_MAP["macos_certificate_name"])
 
-    @property
+    @cached_property
     def macos_notarization_apple_id(self) -> Optional[str]:
         """Apple ID for macOS notarization"""
-        return os.environ.get("PROD_MACOS_NOTARIZATION_APPLE_ID")
+        return os.environ.get(self._ENV_VAR_MAP["macos_notarization_apple_id"])
 
-    @property
+    @cached_property
     def macos_notarization_team_id(self) -> Optional[str]:
         """Team ID for macOS notarization"""
-        return os.environ.get("PROD_MACOS_NOTARIZATION_TEAM_ID")
+        return os.environ.get(self._ENV_VAR_MAP["macos_notarization_team_id"])
 
-    @property
+    @cached_property
     def macos_notarization_password(self) -> Optional[str]:
         """App-specific password for macOS notarization"""
-        return os.environ.get("PROD_MACOS_NOTARIZATION_PWD")
+        return os.environ.get(self._ENV_VAR_MAP["macos_notarization_password"])
 
     # === Windows Code Signing ===
 
-    @property
+    @cached_property
     def code_sign_tool_path(self) -> Optional[str]:
         """Path to Windows code signing tool directory"""
-        return os.environ.get("CODE_SIGN_TOOL_PATH")
+        return os.environ.get(self._ENV_VAR_MAP["code_sign_tool_path"])
 
-    @property
+    @cached_property
     def esigner_username(self) -> Optional[str]:
         """eSigner username for Windows code signing"""
-        return os.environ.get("ESIGNER_USERNAME")
+        return os.environ.get(self._ENV_VAR_MAP["esigner_username"])
 
-    @property
+    @cached_property
     def esigner_password(self) -> Optional[str]:
         """eSigner password for Windows code signing"""
-        return os.environ.get("ESIGNER_PASSWORD")
+        return os.environ.get(self._ENV_VAR_MAP["esigner_password"])
 
-    @property
+    @cached_property
     def esigner_totp_secret(self) -> Optional[str]:
         """eSigner TOTP secret for Windows code signing"""
-        return os.environ.get("ESIGNER_TOTP_SECRET")
+        return os.environ.get(self._ENV_VAR_MAP["esigner_totp_secret"])
 
-    @property
+    @cached_property
     def esigner_credential_id(self) -> Optional[str]:
         """eSigner credential ID for Windows code signing"""
-        return os.environ.get("ESIGNER_CREDENTIAL_ID")
+        return os.environ.get(self._ENV_VAR_MAP["esigner_credential_id"])
 
     # === Upload & Distribution (Cloudflare R2) ===
 
-    @property
+    @cached_property
     def r2_account_id(self) -> Optional[str]:
         """Cloudflare account ID for R2"""
-        return os.environ.get("R2_ACCOUNT_ID")
+        return os.environ.get(self._ENV_VAR_MAP["r2_account_id"])
 
-    @property
+    @cached_property
     def r2_access_key_id(self) -> Optional[str]:
         """R2 access key ID"""
-        return os.environ.get("R2_ACCESS_KEY_ID")
+        return os.environ.get(self._ENV_VAR_MAP["r2_access_key_id"])
 
-    @property
+    @cached_property
     def r2_secret_access_key(self) -> Optional[str]:
         """R2 secret access key"""
-        return os.environ.get("R2_SECRET_ACCESS_KEY")
+        return os.environ.get(self._ENV_VAR_MAP["r2_secret_access_key"])
 
-    @property
+    @cached_property
     def r2_bucket(self) -> str:
         """R2 bucket name (default: browseros)"""
-        return os.environ.get("R2_BUCKET", "browseros")
+        return os.environ.get(self._ENV_VAR_MAP["r2_bucket"], "browseros")
 
-    @property
+    @cached_property
     def r2_cdn_base_url(self) -> str:
         """CDN base URL for R2 artifacts (default: http://cdn.browseros.com)"""
-        return os.environ.get("R2_CDN_BASE_URL", "http://cdn.browseros.com")
+        return os.environ.get(
+            self._ENV_VAR_MAP["r2_cdn_base_url"], "http://cdn.browseros.com"
+        )
 
-    @property
+    @cached_property
     def r2_endpoint_url(self) -> Optional[str]:
         """R2 S3-compatible endpoint URL (computed from account ID)"""
         account_id = self.r2_account_id
@@ -160,20 +226,24 @@ class EnvConfig:
 
     # === Sparkle Signing (macOS) ===
 
-    @property
+    @cached_property
     def sparkle_private_key(self) -> Optional[str]:
         """Base64-encoded Sparkle Ed25519 private key for macOS auto-update signing"""
-        return os.environ.get("SPARKLE_PRIVATE_KEY")
+        return os.environ.get(self._ENV_VAR_MAP["sparkle_private_key"])
 
     # === Notifications ===
 
-    @property
+    @cached_property
     def slack_webhook_url(self) -> Optional[str]:
         """Slack webhook URL for build notifications"""
-        return os.environ.get("SLACK_WEBHOOK_URL")
+        return os.environ.get(self._ENV_VAR_MAP["slack_webhook_url"])
 
     # === Helper Methods ===
 
+    def refresh(self) -> None:
+        """Drop cached values so the next access re-reads os.environ"""
+        self.__dict__.clear()
+
     def get_macos_signing_config(self) -> dict:
         """
         Get all macOS signing configuration as a dict
@@ -219,8 +289,9 @@ class EnvConfig:
         """
         missing = []
         for var_name in var_names:
-            # Convert property name to env var name (e.g., chromium_src -> CHROMIUM_SRC)
-            env_var = var_name.upper()
+            # Property names map to their env var (e.g., macos_notarization_apple_id
+            # -> PROD_MACOS_NOTARIZATION_APPLE_ID); anything else is uppercased
+            env_var = self._ENV_VAR_MAP.get(var_name) or var_name.upper()
             if not os.environ.get(env_var):
                 missing.append(env_var)
 
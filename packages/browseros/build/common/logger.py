@@ -7,6 +7,7 @@ Provides consistent logging with Typer output and file logging
 import typer
 from pathlib import Path
 from datetime import datetime
+from typing import List
 
 # Global log file handle
 _log_file = None
@@ -48,6 +49,17 @@ def log_info(message: str):
     _log_to_file(f"INFO: {message}")
 
 
+def log_info_lines(messages: List[str]):
+    """Print several info messages with one write and one log file flush"""
+    if not messages:
+        return
+    typer.echo("\n".join(messages))
+    log_file = _ensure_log_file()
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    log_file.write("".join(f"[{timestamp}] INFO: {m}\n" for m in messages))
+    log_file.flush()
+
+
 def log_warning(message: str):
     """Print warning message with color"""
     typer.secho(f"⚠️  {message}", fg=typer.colors.YELLOW)
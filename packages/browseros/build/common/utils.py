@@ -14,6 +14,7 @@ from typing import Optional, List, Dict, Union
 # Import logging functions from logger module - re-exported for other modules
 from .logger import (  # noqa: F401
     log_info,
+    log_info_lines,
     log_error,
     log_warning,
     log_success,
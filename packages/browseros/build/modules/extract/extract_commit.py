@@ -9,6 +9,7 @@ from ...common.context import Context
 from ...common.module import CommandModule, ValidationError
 from ...common.utils import log_info, log_success, log_warning
 from .utils import (
+    GitBatch,
     GitError,
     validate_git_repository,
     validate_commit_exists,
@@ -24,6 +25,7 @@ def extract_single_commit(
     force: bool = False,
     include_binary: bool = False,
     base: Optional[str] = None,
+    git_batch: Optional[GitBatch] = None,
 ) -> Tuple[int, List[str]]:
     """Extract patches from a single commit
 
@@ -34,17 +36,22 @@ def extract_single_commit(
         force: Overwrite existing patches
         include_binary: Include binary files
         base: If provided, extract full diff from base for files in commit
+        git_batch: Open GitBatch to use for commit lookups (batch extraction)
 
     Returns:
         Tuple of (count, list of extracted file paths)
     """
     # Step 1: Validate commit
-    if not validate_commit_exists(commit_hash, ctx.chromium_src):
+    if git_batch:
+        exists = git_batch.exists(commit_hash)
+    else:
+        exists = validate_commit_exists(commit_hash, ctx.chromium_src)
+    if not exists:
         raise GitError(f"Commit not found: {commit_hash}")
 
-    # Get commit info for logging
-    commit_info = get_commit_info(commit_hash, ctx.chromium_src)
-    if commit_info and verbose:
+    # Get commit info for logging (only shown in verbose mode)
+    commit_info = get_commit_info(commit_hash, ctx.chromium_src) if verbose else None
+    if commit_info:
         log_info(
             f"  Author: {commit_info['author_name']} <{commit_info['author_email']}>"
         )
@@ -3,6 +3,7 @@ Extract Range - Extract patches from a range of git commits.
 """
 
 import click
+from contextlib import nullcontext
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -11,6 +12,7 @@ from ...common.module import CommandModule, ValidationError
 from ...common.utils import log_info, log_error, log_success, log_warning
 from .utils import (
     FileOperation,
+    GitBatch,
     GitError,
     run_git_command,
     validate_git_repository,
@@ -207,7 +209,10 @@ def extract_commits_individually(
     all_extracted_files: List[str] = []
     failed_commits = []
 
-    with click.progressbar(
+    # One git cat-file process answers commit lookups for the whole range;
+    # extract_with_base doesn't look commits up, so it needs none
+    batch_context = nullcontext() if custom_base else GitBatch(ctx.chromium_src)
+    with batch_context as git_batch, click.progressbar(
         commits, label="Processing commits", show_pos=True, show_percent=True
     ) as commits_bar:
         for commit in commits_bar:
@@ -230,6 +235,7 @@ def extract_commits_individually(
                         verbose=False,
                         force=force,
                         include_binary=include_binary,
+                        git_batch=git_batch,
                     )
                 total_extracted += extracted
                 all_extracted_files.extend(files)
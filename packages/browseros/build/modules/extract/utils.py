@@ -8,8 +8,9 @@ and patch management with comprehensive error handling.
 import subprocess
 import click
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import IO, Optional, List, Dict, Tuple
 from enum import Enum
 from dataclasses import dataclass
 from ...common.context import Context
@@ -45,6 +46,19 @@ class GitError(Exception):
     pass
 
 
+# Full object names are immutable, so lookups on them are safe to cache.
+# Refs like HEAD or branch names can move and are always re-resolved.
+_OBJECT_NAME_RE = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+
+# (commit_hash, chromium_src) pairs already known to exist
+_known_commits: set = set()
+
+
+def _is_object_name(commit_hash: str) -> bool:
+    """Check if commit_hash is a full object name rather than a ref"""
+    return _OBJECT_NAME_RE.fullmatch(commit_hash) is not None
+
+
 def run_git_command(
     cmd: List[str],
     cwd: Path,
@@ -135,6 +149,9 @@ def validate_git_repository(path: Path) -> bool:
 
 def validate_commit_exists(commit_hash: str, chromium_src: Path) -> bool:
     """Validate that a commit exists in the repository"""
+    if (commit_hash, str(chromium_src)) in _known_commits:
+        return True
+
     try:
         result = run_git_command(
             ["git", "rev-parse", "--verify", f"{commit_hash}^{{commit}}"],
@@ -144,12 +161,85 @@ def validate_commit_exists(commit_hash: str, chromium_src: Path) -> bool:
         if result.returncode != 0:
             log_error(f"Commit '{commit_hash}' not found in repository")
             return False
+        if _is_object_name(commit_hash):
+            _known_commits.add((commit_hash, str(chromium_src)))
         return True
     except GitError as e:
         log_error(f"Failed to validate commit: {e}")
         return False
 
 
+class GitBatch:
+    """Long-lived `git cat-file --batch-check` process for commit lookups
+
+    Answers existence queries for many commits from one git process
+    instead of spawning rev-parse per commit.
+
+    Usage:
+        with GitBatch(chromium_src) as git_batch:
+            if git_batch.exists(commit_hash):
+                ...
+    """
+
+    def __init__(self, chromium_src: Path):
+        self.chromium_src = chromium_src
+        self._process: Optional[subprocess.Popen] = None
+        self._stdin: Optional[IO[bytes]] = None
+        self._stdout: Optional[IO[bytes]] = None
+
+    def __enter__(self) -> "GitBatch":
+        try:
+            process = subprocess.Popen(
+                ["git", "cat-file", "--batch-check"],
+                cwd=self.chromium_src,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise GitError(f"Failed to start git cat-file: {e}")
+        assert process.stdin is not None and process.stdout is not None
+        self._process = process
+        self._stdin = process.stdin
+        self._stdout = process.stdout
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._process is None:
+            return
+        for pipe in (self._stdin, self._stdout):
+            try:
+                if pipe:
+                    pipe.close()
+            except OSError:
+                pass  # git already exited, e.g. broken pipe on final flush
+        self._process.wait()
+        self._process = None
+        self._stdin = None
+        self._stdout = None
+
+    def exists(self, commit_hash: str) -> bool:
+        """Check whether a commit exists in the repository"""
+        stdin, stdout = self._stdin, self._stdout
+        if stdin is None or stdout is None:
+            raise GitError("GitBatch used outside of its context")
+        if not commit_hash or any(c.isspace() for c in commit_hash):
+            return False
+
+        try:
+            stdin.write(f"{commit_hash}^{{commit}}\n".encode())
+            stdin.flush()
+            line = stdout.readline().decode()
+        except OSError as e:
+            raise GitError(f"git cat-file --batch-check failed: {e}")
+        if not line:
+            raise GitError("git cat-file --batch-check exited unexpectedly")
+
+        # "<hash> commit <size>" on success, "<input> missing" otherwise
+        fields = line.split()
+        return len(fields) == 3 and fields[1] == "commit"
+
+
 def get_commit_changed_files(commit_hash: str, chromium_src: Path) -> List[str]:
     """Get list of files changed in a commit"""
     try:
@@ -550,6 +640,24 @@ def create_git_commit(chromium_src: Path, message: str) -> bool:
 
 def get_commit_info(commit_hash: str, chromium_src: Path) -> Optional[Dict[str, str]]:
     """Get detailed information about a commit"""
+    if _is_object_name(commit_hash):
+        info = _get_commit_info_cached(commit_hash, str(chromium_src))
+        return dict(info) if info else None
+    return _read_commit_info(commit_hash, chromium_src)
+
+
+@lru_cache(maxsize=4096)
+def _get_commit_info_cached(
+    commit_hash: str, chromium_src: str
+) -> Optional[Dict[str, str]]:
+    """Memoized get_commit_info for full object names"""
+    return _read_commit_info(commit_hash, Path(chromium_src))
+
+
+def _read_commit_info(
+    commit_hash: str, chromium_src: Path
+) -> Optional[Dict[str, str]]:
+    """Read commit metadata with git show"""
     try:
         # Get commit info in a structured format
         result = run_git_command(
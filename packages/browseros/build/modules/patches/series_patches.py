@@ -1,39 +1,87 @@
 #!/usr/bin/env python3
 """Series-based patch module for BrowserOS build system (GNU Quilt format)"""
 
+import hashlib
+import os
+import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator
+from typing import Iterable, Iterator, Optional
 
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
-from ...common.utils import log_info, log_success, log_error, get_platform
+from ...common.utils import (
+    log_info,
+    log_info_lines,
+    log_success,
+    log_error,
+    get_platform,
+)
 
 
 ENCODING = "UTF-8"
 
+# Captures the patch path of a series line; comment-only and blank lines
+# don't match, and inline " #" comments plus surrounding whitespace are dropped
+_SERIES_LINE = re.compile(r"\s*([^#\s](?:.*?\S)??)(?:\s* #.*)?\s*$")
+
+# git apply arguments; each call prepends the git binary and appends the
+# patch path (if any)
+_APPLY_BASE = ("apply", "--ignore-whitespace", "--whitespace=nowarn", "-p1")
+_APPLY_3WAY = ("apply", "--3way", "--ignore-whitespace", "--whitespace=nowarn", "-p1")
+_APPLY_CHECK = ("apply", "--check", "--ignore-whitespace", "-p1")
+
+# A patch must contain at least one file header for git apply to act on it;
+# inside a concatenated stream git silently skips members without one
+_PATCH_HEADER = re.compile(rb"^(?:diff --git |--- .*\n\+\+\+ )", re.MULTILINE)
+
+# Max patches handed to a single `git apply` invocation
+APPLY_BATCH_SIZE = 64
+
+# Fingerprint of the last fully applied series, stored under chromium's .git
+SERIES_FINGERPRINT_FILE = "browseros_series_applied"
+
+# Per-patch progress lines are buffered and printed this many at a time
+PROGRESS_BATCH_SIZE = 32
+
+
+# (series files read, [(relative_path, series_file), ...])
+SeriesPatches = tuple[list[Path], list[tuple[str, Path]]]
+
 
 class SeriesPatchesModule(CommandModule):
     produces = []
     requires = []
     description = "Apply series-based patches (GNU Quilt format)"
 
+    _series: Optional[SeriesPatches] = None
+
     def validate(self, ctx: Context) -> None:
-        if not shutil.which("git"):
+        if not get_git_binary():
             raise ValidationError("Git is not available in PATH")
 
         series_dir = ctx.get_series_patches_dir()
-        if not series_dir.exists():
-            raise ValidationError(f"Series patches directory not found: {series_dir}")
-
         series_file = series_dir / "series"
-        if not series_file.exists():
+        try:
+            # Opening the file also tells us whether the directory exists
+            with series_file.open(encoding=ENCODING):
+                pass
+        except FileNotFoundError:
+            if not series_dir.is_dir():
+                raise ValidationError(f"Series patches directory not found: {series_dir}")
             raise ValidationError(f"Series file not found: {series_file}")
 
+        # Parse once here so execute() doesn't re-read the series files
+        self._series = collect_series_patches(series_dir)
+
     def execute(self, ctx: Context) -> None:
         log_info("\n🩹 Applying series patches...")
-        applied, failed = apply_series_patches_impl(ctx)
+        applied, failed = apply_series_patches_impl(
+            ctx, series=self._series, three_way=ctx.env.series_patches_three_way
+        )
 
         if failed:
             raise RuntimeError(f"Failed to apply {len(failed)} series patches")
@@ -41,6 +89,17 @@ class SeriesPatchesModule(CommandModule):
         log_success(f"Applied {len(applied)} series patches")
 
 
+@lru_cache(maxsize=1)
+def get_git_binary() -> Optional[str]:
+    """Absolute path to git, resolved from PATH once per process"""
+    return shutil.which("git")
+
+
+def _git() -> str:
+    """git binary to exec, falling back to a PATH lookup if unresolved"""
+    return get_git_binary() or "git"
+
+
 def parse_series(series_path: Path) -> Iterator[str]:
     """
     Parse a GNU Quilt series file, yielding patch paths.
@@ -52,98 +111,267 @@ def parse_series(series_path: Path) -> Iterator[str]:
     - Blank lines are ignored
     """
     with series_path.open(encoding=ENCODING) as f:
-        lines = f.read().splitlines()
+        for raw in f:
+            m = _SERIES_LINE.match(raw)
+            if m:
+                yield m.group(1)
 
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        if line.startswith("#"):
-            continue
-        # Strip inline comments
-        if " #" in line:
-            line = line.split(" #")[0].strip()
-        if line:
-            yield line
 
-
-def get_series_files(series_dir: Path) -> list[Path]:
+def collect_series_patches(series_dir: Path) -> SeriesPatches:
     """
-    Get all applicable series files for the current platform.
+    Read all applicable series files for the current platform.
 
-    Returns series files in order:
+    Series files are read in order:
     1. series (common, always applied)
     2. series.{platform} (platform-specific: windows, linux, macos)
 
-    Only returns files that exist.
+    Missing series files are skipped.
+
+    Returns:
+        (series_files_read, [(relative_path, series_file), ...])
     """
-    files = []
+    platform = get_platform()  # "windows", "linux", or "macos"
+    candidates = [series_dir / "series", series_dir / f"series.{platform}"]
+
+    series_files = []
+    all_patches: list[tuple[str, Path]] = []
+    for series_file in candidates:
+        try:
+            entries = list(parse_series(series_file))
+        except FileNotFoundError:
+            continue
+        series_files.append(series_file)
+        all_patches.extend((relative_path, series_file) for relative_path in entries)
 
-    # Common series file (always)
-    common = series_dir / "series"
-    if common.exists():
-        files.append(common)
+    return series_files, all_patches
 
-    # Platform-specific series file
-    platform = get_platform()  # "windows", "linux", or "macos"
-    platform_file = series_dir / f"series.{platform}"
-    if platform_file.exists():
-        files.append(platform_file)
 
-    return files
+def _read_patch(patch_path: str) -> Optional[bytes]:
+    """Read a patch file, returning None if it doesn't exist"""
+    try:
+        with open(patch_path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def read_patch_files(patch_paths: list[str]) -> list[Optional[bytes]]:
+    """
+    Read all patch files up front, overlapping the I/O across threads.
+
+    Returns:
+        Patch contents in input order, None for files that don't exist
+    """
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(_read_patch, patch_paths))
 
 
-def apply_single_patch(patch_path: Path, chromium_src: Path) -> tuple[bool, str]:
+def apply_single_patch(patch_path: str, chromium_src: Path) -> tuple[bool, str]:
     """
-    Apply a single patch using git apply.
+    Apply a single patch using git apply, falling back to a 3-way merge.
 
     Returns:
         (success, error_message)
     """
-    cmd = [
-        "git", "apply",
-        "--ignore-whitespace",
-        "--whitespace=nowarn",
-        "-p1",
-        str(patch_path)
-    ]
+    success, error, _ = _apply_single_patch(patch_path, chromium_src)
+    return success, error
+
+
+def _apply_single_patch(
+    patch_path: str, chromium_src: Path, skip_plain: bool = False
+) -> tuple[bool, str, bool]:
+    """
+    apply_single_patch(), also reporting whether plain git apply succeeded.
 
+    skip_plain goes straight to --3way. Only pass it when a plain apply of
+    this patch onto the current tree is already known to fail: --3way
+    implies --index, so on its own it fails with "does not match index" on
+    files an earlier, unstaged patch in the series changed.
+
+    Returns:
+        (success, error_message, applied_with_plain_apply)
+    """
+    if not skip_plain:
+        result = subprocess.run(
+            [_git(), *_APPLY_BASE, patch_path],
+            cwd=chromium_src,
+            capture_output=True
+        )
+
+        if result.returncode == 0:
+            return True, "", True
+
+    # Fallback to 3-way merge
     result = subprocess.run(
-        cmd,
+        [_git(), *_APPLY_3WAY, patch_path],
         cwd=chromium_src,
-        capture_output=True,
-        text=True
+        capture_output=True
     )
 
     if result.returncode == 0:
-        return True, ""
+        return True, "", False
 
-    # Fallback to 3-way merge
-    cmd_3way = [
-        "git", "apply",
-        "--3way",
-        "--ignore-whitespace",
-        "--whitespace=nowarn",
-        "-p1",
-        str(patch_path)
-    ]
+    # Output is only decoded when there is an error to report
+    error = (result.stderr or result.stdout).decode(ENCODING, errors="replace")
+    return False, error, False
+
+
+def has_patch_header(data: bytes) -> bool:
+    """Check that patch bytes contain a diff header git apply would act on"""
+    return _PATCH_HEADER.search(data) is not None
+
+
+def _join_patches(patch_data: Iterable[bytes]) -> bytes:
+    """Concatenate patches into one stream for git apply on stdin"""
+    chunks = []
+    for data in patch_data:
+        if data and not data.endswith(b"\n"):
+            data += b"\n"
+        chunks.append(data)
+    return b"".join(chunks)
+
+
+def apply_patch_batch(
+    patches: list[tuple[str, bytes]], chromium_src: Path, three_way: bool = False
+) -> list[tuple[bool, str]]:
+    """
+    Apply patches in order, using as few git apply invocations as possible.
+
+    Takes (patch_path, patch_bytes) pairs. The batch is concatenated and fed
+    to git apply on stdin. As a single patch stream it is applied atomically,
+    so a failing batch leaves the tree untouched (passing several patch files
+    as arguments would not). A failing batch is split in half and each half
+    retried until the failing patch is isolated and handed to
+    apply_single_patch for the 3-way fallback.
+
+    Every patch must pass has_patch_header(): git skips a diff-less member
+    of the stream, so the batch would report it applied.
 
+    Args:
+        three_way: For a patch whose plain apply is already known to fail
+            (see _apply_patch_batch), go straight to --3way
+
+    Returns:
+        (success, error_message) for each patch, in input order
+    """
+    results, _ = _apply_patch_batch(patches, chromium_src, three_way, False)
+    return results
+
+
+def _apply_patch_batch(
+    patches: list[tuple[str, bytes]],
+    chromium_src: Path,
+    three_way: bool,
+    known_to_fail: bool,
+) -> tuple[list[tuple[bool, str]], bool]:
+    """
+    Recursive worker for apply_patch_batch().
+
+    known_to_fail means a plain apply of this batch onto the current tree is
+    already proven to fail: the enclosing batch failed and everything before
+    this half then went in with plain git apply. The batch call is skipped,
+    and for a single patch the plain call may be too (three_way).
+
+    Returns:
+        (per-patch results, whether every patch applied with plain git apply)
+    """
+    if len(patches) == 1:
+        success, error, clean = _apply_single_patch(
+            patches[0][0], chromium_src, skip_plain=three_way and known_to_fail
+        )
+        return [(success, error)], clean
+
+    if not known_to_fail:
+        result = subprocess.run(
+            [_git(), *_APPLY_BASE],
+            cwd=chromium_src,
+            input=_join_patches(data for _, data in patches),
+            capture_output=True,
+        )
+
+        if result.returncode == 0:
+            return [(True, "")] * len(patches), True
+
+    mid = len(patches) // 2
+    left, left_clean = _apply_patch_batch(
+        patches[:mid], chromium_src, three_way, False
+    )
+    # If the left half applied exactly as it would within the batch, the
+    # batch's failure must come from the right half
+    right, right_clean = _apply_patch_batch(
+        patches[mid:], chromium_src, three_way, left_clean
+    )
+    return left + right, left_clean and right_clean
+
+
+def check_single_patch(patch_data: bytes, chromium_src: Path) -> bool:
+    """Check whether a patch would apply cleanly using git apply --check.
+
+    Takes the patch bytes already read by read_patch_files(), fed on stdin,
+    so a missing file is detected by the read rather than from git's
+    (localized) error text.
+    """
     result = subprocess.run(
-        cmd_3way,
+        [_git(), *_APPLY_CHECK],
+        cwd=chromium_src,
+        input=patch_data,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    return result.returncode == 0
+
+
+def _get_fingerprint_state(chromium_src: Path) -> Optional[tuple[str, Path]]:
+    """Get (HEAD commit, fingerprint file path) for chromium_src, if it's a git repo"""
+    result = subprocess.run(
+        [_git(), "rev-parse", "HEAD", "--git-path", SERIES_FINGERPRINT_FILE],
         cwd=chromium_src,
         capture_output=True,
         text=True
     )
+    lines = result.stdout.splitlines()
+    if result.returncode != 0 or len(lines) != 2:
+        return None
+    head, fingerprint_path = lines
+    return head, Path(chromium_src, fingerprint_path)
+
+
+def compute_series_fingerprint(
+    head: str, series_files: list[Path], patch_data: list[bytes]
+) -> str:
+    """Hash the chromium HEAD together with the series files and patch contents"""
+    digest = hashlib.sha256(head.encode())
+    for series_file in series_files:
+        digest.update(series_file.name.encode())
+        digest.update(series_file.read_bytes())
+    for data in patch_data:
+        digest.update(hashlib.sha256(data).digest())
+    return digest.hexdigest()
 
-    if result.returncode == 0:
-        return True, ""
 
-    return False, result.stderr or result.stdout
+def _series_still_applied(chromium_src: Path, patch_data: list[bytes]) -> bool:
+    """
+    Check that every patch is present in the tree by reverse-applying all of them.
+
+    Patches are fed in series order. git apply -R reverses the combined
+    stream as a whole, so stacked patches (a later patch editing lines an
+    earlier one added) only check cleanly this way.
+    """
+    result = subprocess.run(
+        [_git(), "apply", "-R", "--check", "--ignore-whitespace", "-p1"],
+        cwd=chromium_src,
+        input=_join_patches(patch_data),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    return result.returncode == 0
 
 
 def apply_series_patches_impl(
     ctx: Context,
-    dry_run: bool = False
+    dry_run: bool = False,
+    series: Optional[SeriesPatches] = None,
+    three_way: bool = False
 ) -> tuple[list[Path], list[Path]]:
     """
     Apply all patches listed in series files (common + platform-specific).
@@ -151,24 +379,24 @@ def apply_series_patches_impl(
     Args:
         ctx: Build context
         dry_run: If True, only check if patches would apply
+        series: Result of collect_series_patches(), if already read
+        three_way: Skip the redundant plain git apply for a patch whose plain
+            failure is already proven by the batch split (see apply_patch_batch)
 
     Returns:
         (applied_patches, failed_patches)
     """
     series_dir = ctx.get_series_patches_dir()
     chromium_src = ctx.chromium_src
+    # Patch paths are handled as plain strings; Path objects are only
+    # built for the returned lists
+    series_dir_str = os.fspath(series_dir)
 
-    series_files = get_series_files(series_dir)
+    series_files, all_patches = series or collect_series_patches(series_dir)
     if not series_files:
         log_info("  No series files found")
         return [], []
 
-    # Collect all patches from all series files
-    all_patches: list[tuple[str, Path]] = []  # (relative_path, series_file)
-    for series_file in series_files:
-        for relative_path in parse_series(series_file):
-            all_patches.append((relative_path, series_file))
-
     total = len(all_patches)
     if total == 0:
         log_info("  No patches listed in series files")
@@ -177,46 +405,128 @@ def apply_series_patches_impl(
     platform = get_platform()
     log_info(f"  Found {total} patches for platform '{platform}' across {len(series_files)} series file(s)")
 
-    applied = []
-    failed = []
-
-    for i, (relative_path, series_file) in enumerate(all_patches, 1):
-        patch_path = series_dir / relative_path
-
-        if not patch_path.exists():
-            log_error(f"  [{i}/{total}] ✗ Patch file not found: {relative_path}")
-            failed.append(patch_path)
-            continue
-
-        if dry_run:
-            cmd = [
-                "git", "apply",
-                "--check",
-                "--ignore-whitespace",
-                "-p1",
-                str(patch_path)
-            ]
-            result = subprocess.run(
-                cmd,
-                cwd=chromium_src,
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                log_info(f"  [{i}/{total}] ✓ Would apply: {relative_path}")
+    applied: list[str] = []
+    failed: list[str] = []
+
+    # Successful progress lines are buffered; errors flush them first so
+    # output stays in series order
+    progress: list[str] = []
+
+    def log_progress(message: str) -> None:
+        progress.append(message)
+        if len(progress) >= PROGRESS_BATCH_SIZE:
+            flush_progress()
+
+    def flush_progress() -> None:
+        log_info_lines(progress)
+        progress.clear()
+
+    def log_failure(message: str) -> None:
+        flush_progress()
+        log_error(message)
+
+    if dry_run:
+        # Checks run against the untouched tree, so they are independent
+        # of each other and can overlap git startup across workers.
+        patch_paths = [
+            os.path.join(series_dir_str, relative_path) for relative_path, _ in all_patches
+        ]
+        patch_data = read_patch_files(patch_paths)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            check_results = list(executor.map(
+                lambda d: None if d is None else check_single_patch(d, chromium_src),
+                patch_data
+            ))
+
+        for i, ((relative_path, _), patch_path, ok) in enumerate(
+            zip(all_patches, patch_paths, check_results), 1
+        ):
+            if ok is None:
+                log_failure(f"  [{i}/{total}] ✗ Patch file not found: {relative_path}")
+                failed.append(patch_path)
+            elif ok:
+                log_progress(f"  [{i}/{total}] ✓ Would apply: {relative_path}")
                 applied.append(patch_path)
             else:
-                log_error(f"  [{i}/{total}] ✗ Would fail: {relative_path}")
+                log_failure(f"  [{i}/{total}] ✗ Would fail: {relative_path}")
                 failed.append(patch_path)
-        else:
-            success, error = apply_single_patch(patch_path, chromium_src)
+
+        flush_progress()
+        return [Path(p) for p in applied], [Path(p) for p in failed]
+
+    # Patches may build on earlier ones, so batches are applied in order
+    pending: list[tuple[int, str, str, bytes]] = []
+
+    def flush_pending() -> None:
+        if not pending:
+            return
+        results = apply_patch_batch(
+            [(p, d) for _, _, p, d in pending], chromium_src, three_way
+        )
+        for (i, relative_path, patch_path, _), (success, error) in zip(pending, results):
             if success:
-                log_info(f"  [{i}/{total}] ✓ Applied: {relative_path}")
+                log_progress(f"  [{i}/{total}] ✓ Applied: {relative_path}")
                 applied.append(patch_path)
             else:
-                log_error(f"  [{i}/{total}] ✗ Failed: {relative_path}")
+                log_failure(f"  [{i}/{total}] ✗ Failed: {relative_path}")
                 if error:
                     log_error(f"      {error.strip()}")
                 failed.append(patch_path)
+        pending.clear()
+
+    patch_paths = [
+        os.path.join(series_dir_str, relative_path) for relative_path, _ in all_patches
+    ]
+    patch_data = read_patch_files(patch_paths)
+
+    # Skip the whole series if this exact series was already applied on top
+    # of the current HEAD. The marker alone can't tell whether the tree was
+    # reset since, so a single reverse --check confirms it.
+    fingerprint_path: Optional[Path] = None
+    fingerprint = ""
+    present_data = [data for data in patch_data if data is not None]
+    fingerprint_state = None
+    if len(present_data) == total:
+        fingerprint_state = _get_fingerprint_state(chromium_src)
+    if fingerprint_state:
+        head, fingerprint_path = fingerprint_state
+        fingerprint = compute_series_fingerprint(head, series_files, present_data)
+        try:
+            previous = fingerprint_path.read_text(encoding=ENCODING).strip()
+        except OSError:
+            previous = None
+        if previous == fingerprint and _series_still_applied(chromium_src, present_data):
+            log_info("  Series already applied (fingerprint match), skipping")
+            return [Path(p) for p in patch_paths], []
+
+    for i, ((relative_path, _), patch_path, data) in enumerate(
+        zip(all_patches, patch_paths, patch_data), 1
+    ):
+        if data is None:
+            flush_pending()
+            log_failure(f"  [{i}/{total}] ✗ Patch file not found: {relative_path}")
+            failed.append(patch_path)
+            continue
+
+        if not has_patch_header(data):
+            # git apply fails these on their own, but skips them in a batch
+            flush_pending()
+            log_failure(f"  [{i}/{total}] ✗ Failed: {relative_path}")
+            log_error("      error: No valid patches in input")
+            failed.append(patch_path)
+            continue
+
+        pending.append((i, relative_path, patch_path, data))
+        if len(pending) >= APPLY_BATCH_SIZE:
+            flush_pending()
+
+    flush_pending()
+    flush_progress()
+
+    if fingerprint_path and not failed:
+        try:
+            fingerprint_path.write_text(fingerprint + "\n", encoding=ENCODING)
+        except OSError as e:
+            log_error(f"  Could not record series fingerprint: {e}")
 
-    return applied, failed
+    return [Path(p) for p in applied], [Path(p) for p in failed]